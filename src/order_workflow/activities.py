@@ -17,6 +17,7 @@ from pathlib import Path
 import uuid
 from temporalio import activity
 from temporalio.exceptions import ApplicationError
+from .pricing import catalogue_version, price_table
 
 
 # Resolve paths to JSON "databases"
@@ -35,7 +36,56 @@ def _write_json(path, data):
     tmp = path.with_suffix(path.suffix + ".tmp")
     with tmp.open("w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+    # Stat before the rename: it keeps inode and mtime, so the key matches our write
+    key = _stat_key(tmp)
     tmp.replace(path)
+    if path == _INVENTORY:
+        _inventory_cache["key"] = key
+        _inventory_cache["data"] = data
+        _inventory_cache["version"] = catalogue_version(data)
+
+# Parsed inventory for read-only callers, reused until the file on disk changes.
+# Our writes go through `_write_json`; atomic replaces elsewhere get a new inode.
+# `version` is the catalogue version, computed once per parse or write.
+_inventory_cache = {"key": None, "data": None, "version": None}
+
+def _stat_key(path):
+    st = path.stat()
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _load_inventory():
+    """Return the shared parsed inventory for read-only callers.
+
+    Re-parses only when the file changed. Never mutate the result: activities
+    that update stock read a fresh private copy with `_read_json`, since the
+    GUI rewrites the file in place and a same-tick, same-size write can slip
+    past the cache key.
+    """
+    key = _stat_key(_INVENTORY)
+    if _inventory_cache["key"] != key:
+        _inventory_cache["data"] = _read_json(_INVENTORY)
+        _inventory_cache["version"] = catalogue_version(_inventory_cache["data"])
+        _inventory_cache["key"] = key
+    return _inventory_cache["data"]
+
+def _prices():
+    """Return the PriceTable for the current catalogue version.
+
+    Our own stock writes refresh the cache and its version, so this normally
+    costs a stat and a dict lookup rather than a parse of the catalogue.
+    """
+    inv = _load_inventory()
+    return price_table(inv, _inventory_cache["version"])
+
+def warm_caches():
+    """Preload the inventory cache so the first real order skips the cold parse.
+
+    Called by the worker before it starts polling. Returns the number of
+    inventory items loaded.
+    """
+    inv = _load_inventory()
+    _prices()
+    return len(inv.get("items", {}))
 
 @activity.defn
 async def generate_order_id():
@@ -50,6 +100,8 @@ async def generate_order_id():
             "payment_status": "pending",
             "shipping_status": "pending",
             "address_status": "pending",
+            "amount": None,
+            "currency": None,
         }
         _write_json(_STATE, state)
     except Exception as e:
@@ -128,14 +180,30 @@ async def process_payment(order_id):
         raise ApplicationError(f"Order ID {order_id} not in the proper state.")
     await asyncio.sleep(0)
     try:
+        quote = _prices().quote([order["item"]])
+    except ValueError as e:
+        raise ApplicationError(f"Failed to price order {order_id}: {e}", non_retryable=True)
+    try:
+        order["amount"] = quote["total"]
+        order["currency"] = quote["currency"]
         order["payment_status"] = "paid"
         order["status"] = "processed"
         _write_json(_STATE, state)
-        return f"Payment for order {order_id} processed."
+        return f"Payment of {quote['total']:.2f} {quote['currency']} for order {order_id} processed."
     except Exception as e:
         raise ApplicationError(f"Failed to process payment for order {order_id}: {e}")
 
 
+@activity.defn
+async def quote_baskets(baskets, discount_rate=0.0):
+    """Price a batch of baskets (item -> qty mappings or lists of items) in one call."""
+    await asyncio.sleep(0)
+    try:
+        return _prices().batch_quote(baskets, discount_rate)
+    except ValueError as e:
+        raise ApplicationError(f"Failed to quote baskets: {e}", non_retryable=True)
+
+
 @activity.defn
 async def arrange_shipping(order_id, item):
     """Finalize order as shipped; adjust inventory and order state."""
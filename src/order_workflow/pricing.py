@@ -0,0 +1,156 @@
+"""
+Pricing helpers for the Order demo.
+
+Prices come from `src/db/inventory.json`. A `PriceTable` flattens the catalogue
+into parallel lists of item names and integer cents so single quotes and large
+batches of baskets are priced with index lookups instead of re-reading JSON.
+
+Talking points for demos:
+- Money is handled in integer cents (converted exactly via Decimal); floats
+  only appear in returned quotes.
+- Tables are shared per catalogue version: `metadata.version` plus a
+  fingerprint of the prices, so stock updates never rebuild them while a price
+  edit does, with or without a version bump.
+"""
+
+from __future__ import annotations
+from decimal import Decimal, ROUND_HALF_UP
+import math
+
+DEFAULT_TAX_RATE = 0.0
+
+# Price tables keyed by catalogue version (see catalogue_version)
+_tables = {}
+
+
+def _round_cents(value):
+    """Round a Decimal amount of cents half-up to whole cents."""
+    return int(value.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def _check_rate(name, rate):
+    """Return `rate` as a Decimal, raising ValueError unless it is between 0 and 1."""
+    if isinstance(rate, bool) or not isinstance(rate, (int, float)) or not 0 <= rate <= 1:
+        raise ValueError(f"{name} must be a number between 0 and 1, got {rate!r}.")
+    return Decimal(str(rate))
+
+
+def _price_cents(name, item):
+    """Return an item's price in exact integer cents, raising ValueError if invalid."""
+    price = item.get("price") if isinstance(item, dict) else None
+    if isinstance(price, bool) or not isinstance(price, (int, float)) or not math.isfinite(price) or price < 0:
+        raise ValueError(f"Item {name} has no valid price, got {price!r}.")
+    return _round_cents(Decimal(str(price)) * 100)
+
+
+def _basket_key(basket):
+    """Normalize a basket (name -> qty mapping or list of names) to a hashable key.
+
+    Raises ValueError for malformed baskets, names or quantities.
+    """
+    if isinstance(basket, dict):
+        pairs = basket.items()
+    elif isinstance(basket, (list, tuple)):
+        pairs = ((name, 1) for name in basket)
+    else:
+        raise ValueError(f"Basket must be a mapping or list of items, got {basket!r}.")
+    counts = {}
+    for name, qty in pairs:
+        if not isinstance(name, str):
+            raise ValueError(f"Item name must be a string, got {name!r}.")
+        if isinstance(qty, bool) or not isinstance(qty, int) or qty < 0:
+            raise ValueError(f"Quantity for {name} must be a non-negative integer, got {qty!r}.")
+        counts[name] = counts.get(name, 0) + qty
+    return tuple(sorted(counts.items()))
+
+
+class PriceTable:
+    """Item prices for one catalogue version.
+
+    Raises ValueError for catalogues with missing or invalid prices, currency
+    or tax rate.
+    """
+
+    def __init__(self, inventory):
+        meta = inventory.get("metadata", {})
+        items = inventory.get("items", {})
+        self.currency = meta.get("currency", "USD")
+        if not isinstance(self.currency, str):
+            raise ValueError(f"Currency must be a string, got {self.currency!r}.")
+        self.tax_rate = meta.get("tax_rate", DEFAULT_TAX_RATE)
+        _check_rate("tax_rate", self.tax_rate)
+        self.names = list(items)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.cents = [_price_cents(name, it) for name, it in items.items()]
+
+    def quote(self, basket, discount_rate=0.0, tax_rate=None):
+        """Price one basket; see `batch_quote` for the returned fields."""
+        return self.batch_quote([basket], discount_rate, tax_rate)[0]
+
+    def batch_quote(self, baskets, discount_rate=0.0, tax_rate=None):
+        """Price many baskets at once.
+
+        Each quote is a dict with `currency`, `subtotal`, `discount`, `tax` and
+        `total`. Rates must be between 0 and 1. Raises ValueError for invalid
+        input or items missing from the catalogue.
+        """
+        if tax_rate is None:
+            tax_rate = self.tax_rate
+        discount_dec = _check_rate("discount_rate", discount_rate)
+        tax_dec = _check_rate("tax_rate", tax_rate)
+        if not isinstance(baskets, (list, tuple)):
+            raise ValueError(f"Baskets must be a list, got {baskets!r}.")
+        keys = [_basket_key(b) for b in baskets]
+        index, cents = self.index, self.cents
+        results = []
+        for key in keys:
+            try:
+                subtotal = sum(cents[index[name]] * qty for name, qty in key)
+            except KeyError as e:
+                raise ValueError(f"Item {e.args[0]} not found in inventory.")
+            discount = _round_cents(subtotal * discount_dec)
+            tax = _round_cents((subtotal - discount) * tax_dec)
+            results.append({
+                "currency": self.currency,
+                "subtotal": subtotal / 100,
+                "discount": discount / 100,
+                "tax": tax / 100,
+                "total": (subtotal - discount + tax) / 100,
+            })
+        return results
+
+
+def catalogue_version(inventory):
+    """Identify a catalogue by its metadata and a fingerprint of its prices.
+
+    This walks the whole catalogue, so compute it once per parsed inventory
+    and pass it to `price_table`. Never raises; invalid prices are reported
+    when the table is built.
+    """
+    meta = inventory.get("metadata", {})
+    prices = tuple(
+        (name, repr(it.get("price") if isinstance(it, dict) else it))
+        for name, it in inventory.get("items", {}).items()
+    )
+    return (
+        repr(meta.get("version")),
+        repr(meta.get("currency")),
+        repr(meta.get("tax_rate")),
+        hash(prices),
+    )
+
+
+def price_table(inventory, version=None):
+    """Return the shared PriceTable for this inventory's catalogue version.
+
+    Pass a precomputed `version` to make the lookup constant time; the table
+    is only built when the version changes.
+    """
+    if version is None:
+        version = catalogue_version(inventory)
+    table = _tables.get(version)
+    if table is None:
+        table = PriceTable(inventory)
+        _tables.clear()
+        _tables[version] = table
+    return table
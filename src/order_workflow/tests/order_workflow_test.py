@@ -26,6 +26,7 @@ from ..activities import (
     compensate_order,
     compensate_payment
 )
+from ..worker import ACTIVITY_NAMES, DEFAULT_TASK_QUEUE, load_activities
 from ..workflow import OrderWorkflow
 
 def set_db(wm = {"available": 150, "reserved": 10}, mk = {"available": 6, "reserved": 5}, uc = {"available": 500, "reserved": 25}) -> None:
@@ -201,3 +202,34 @@ async def test_invalid_item() -> None:
     assert result is not None
     assert "completed successfully" in result
     set_db()
+
+
+# Test routing an activity to a dedicated task queue
+@pytest.mark.asyncio
+async def test_shipping_task_queue_routing() -> None:
+    set_db()
+
+    shipping_queue = "shipping-task-queue-test"
+    client = await Client.connect(connection)
+    async with Worker(
+        client,
+        task_queue=DEFAULT_TASK_QUEUE,
+        workflows=[OrderWorkflow],
+        activities=load_activities([n for n in ACTIVITY_NAMES if n != "arrange_shipping"]),
+    ), Worker(
+        client,
+        task_queue=shipping_queue,
+        activities=load_activities(["arrange_shipping"]),
+    ):
+        handle = await client.start_workflow(
+            OrderWorkflow.run,
+            args=["Wireless Mouse", {"arrange_shipping": shipping_queue}],
+            id="shipping-routing-test",
+            task_queue=DEFAULT_TASK_QUEUE,
+        )
+        await handle.result()
+        # Only the shipping worker can run arrange_shipping, so reaching
+        # "shipped" proves the activity was routed to its queue
+        progress = await handle.query(OrderWorkflow.status)
+    set_db()
+    assert progress["state"] == "shipped"
@@ -0,0 +1,121 @@
+"""
+Unit tests for the pricing engine and the activities that use it.
+These do not need a running Temporal Server.
+"""
+
+from __future__ import annotations
+import copy
+import pytest
+from temporalio.exceptions import ApplicationError
+from .. import activities
+from ..pricing import price_table
+from .order_workflow_test import set_db
+
+inventory = {
+    "metadata": {"version": "pricing-test", "currency": "USD"},
+    "items": {
+        "Wireless Mouse": {"sku": "SKU-1001", "price": 24.99, "available": 150, "reserved": 10},
+        "USB-C Cable": {"sku": "SKU-3003", "price": 8.99, "available": 500, "reserved": 25},
+    },
+}
+
+
+def test_quote_totals() -> None:
+    quote = price_table(inventory).quote({"USB-C Cable": 3}, discount_rate=0.1, tax_rate=0.0875)
+    assert quote == {"currency": "USD", "subtotal": 26.97, "discount": 2.7, "tax": 2.12, "total": 26.39}
+
+
+def test_batch_quote() -> None:
+    baskets = [["Wireless Mouse"], ["Wireless Mouse", "USB-C Cable"], {"USB-C Cable": 2}] * 1000
+    quotes = price_table(inventory).batch_quote(baskets)
+    assert len(quotes) == 3000
+    assert [q["total"] for q in quotes[:3]] == [24.99, 33.98, 17.98]
+
+
+def test_table_shared_per_catalogue_version() -> None:
+    table = price_table(inventory)
+    restocked = copy.deepcopy(inventory)
+    restocked["items"]["Wireless Mouse"]["available"] = 0
+    assert price_table(restocked) is table
+    repriced = copy.deepcopy(inventory)
+    repriced["metadata"]["version"] = 2
+    repriced["items"]["Wireless Mouse"]["price"] = 19.99
+    assert price_table(repriced).quote(["Wireless Mouse"])["total"] == 19.99
+
+
+def test_unversioned_catalogues_keyed_by_price() -> None:
+    assert price_table({"items": {"A": {"price": 1}}}).quote(["A"])["total"] == 1.0
+    assert price_table({"items": {"A": {"price": 2}}}).quote(["A"])["total"] == 2.0
+
+
+def test_price_edit_without_version_bump() -> None:
+    table = price_table(inventory)
+    repriced = copy.deepcopy(inventory)
+    repriced["items"]["USB-C Cable"]["price"] = 9.99
+    assert price_table(repriced) is not table
+    assert price_table(repriced).quote(["USB-C Cable"])["total"] == 9.99
+
+
+@pytest.mark.parametrize(
+    "catalogue",
+    [
+        {"items": {"A": {}}},
+        {"items": {"A": {"price": "1.00"}}},
+        {"items": {"A": {"price": -1}}},
+        {"metadata": {"tax_rate": [0.1]}, "items": {"A": {"price": 1}}},
+        {"metadata": {"currency": 840}, "items": {"A": {"price": 1}}},
+    ],
+)
+def test_invalid_catalogue(catalogue) -> None:
+    with pytest.raises(ValueError):
+        price_table(catalogue)
+
+
+def test_unknown_item() -> None:
+    with pytest.raises(ValueError):
+        price_table(inventory).quote(["Paper Airplane"])
+
+
+def test_price_converted_exactly_to_cents() -> None:
+    catalogue = {"metadata": {"version": "exact"}, "items": {"Sticker": {"price": 1.005}}}
+    assert price_table(catalogue).quote(["Sticker"])["total"] == 1.01
+
+
+@pytest.mark.parametrize(
+    "basket, kwargs",
+    [
+        ({"USB-C Cable": "2"}, {}),
+        ({"USB-C Cable": 0.5}, {}),
+        ({"USB-C Cable": -1}, {}),
+        (["USB-C Cable"], {"discount_rate": 1.5}),
+        (["USB-C Cable"], {"discount_rate": -0.1}),
+        (["USB-C Cable"], {"tax_rate": -0.1}),
+        ("USB-C Cable", {}),
+    ],
+)
+def test_invalid_input(basket, kwargs) -> None:
+    with pytest.raises(ValueError):
+        price_table(inventory).quote(basket, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_process_payment_records_amount() -> None:
+    set_db()
+    try:
+        order_id = await activities.generate_order_id()
+        await activities.reserve_inventory(order_id, "Wireless Mouse")
+        await activities.check_payment(order_id)
+        await activities.check_address(order_id)
+        await activities.process_payment(order_id)
+        order = activities._read_json(activities._STATE)["orders"][order_id]
+    finally:
+        set_db()
+    assert order["amount"] == 24.99
+    assert order["currency"] == "USD"
+
+
+@pytest.mark.asyncio
+async def test_quote_baskets_invalid_input() -> None:
+    set_db()
+    with pytest.raises(ApplicationError):
+        await activities.quote_baskets([{"Wireless Mouse": "2"}])
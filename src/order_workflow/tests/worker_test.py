@@ -0,0 +1,62 @@
+"""
+Unit tests for the worker's lazy activity registration and cache warm-up.
+
+These do not need a running Temporal Server.
+"""
+
+from __future__ import annotations
+import json
+import pytest
+from .. import activities
+from ..worker import ACTIVITY_NAMES, load_activities
+from .order_workflow_test import set_db
+
+
+def test_load_all_activities() -> None:
+    loaded = load_activities()
+    assert [fn.__name__ for fn in loaded] == list(ACTIVITY_NAMES)
+
+
+def test_load_activity_subset() -> None:
+    loaded = load_activities(["arrange_shipping", "compensate_shipping"])
+    assert loaded == [activities.arrange_shipping, activities.compensate_shipping]
+
+
+def test_load_duplicate_activities() -> None:
+    loaded = load_activities(["arrange_shipping", "arrange_shipping"])
+    assert loaded == [activities.arrange_shipping]
+
+
+def test_load_unknown_activity() -> None:
+    with pytest.raises(ValueError):
+        load_activities(["arrange_shipping", "teleport_order"])
+
+
+def test_warm_caches() -> None:
+    set_db()
+    assert activities.warm_caches() == 3
+
+
+def test_inventory_cache_write_through() -> None:
+    set_db()
+    activities._load_inventory()
+    inv = activities._read_json(activities._INVENTORY)
+    inv["items"]["Wireless Mouse"]["available"] = 149
+    activities._write_json(activities._INVENTORY, inv)
+    # Same size and possibly the same mtime tick, but the cache holds our write
+    assert activities._load_inventory()["items"]["Wireless Mouse"]["available"] == 149
+    set_db()
+
+
+def test_inventory_cache_sees_external_writes() -> None:
+    set_db()
+    activities._load_inventory()
+    # set_db rewrites the file in place; an atomic replace from another process
+    # gets a new inode, which the cache key must notice even within the same tick
+    inv = activities._read_json(activities._INVENTORY)
+    inv["items"]["Wireless Mouse"]["available"] = 149
+    tmp = activities._INVENTORY.with_suffix(".json.other")
+    tmp.write_text(json.dumps(inv, indent=2), encoding="utf-8")
+    tmp.replace(activities._INVENTORY)
+    assert activities._load_inventory()["items"]["Wireless Mouse"]["available"] == 149
+    set_db()
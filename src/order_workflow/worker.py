@@ -1,22 +1,8 @@
 from __future__ import annotations
 
+import argparse
 import asyncio
-from temporalio.client import Client
-from temporalio.worker import Worker
-
-from .activities import (
-    generate_order_id,
-    reserve_inventory,
-    check_payment,
-    check_address,
-    process_payment,
-    arrange_shipping,
-    compensate_inventory_reserve,
-    compensate_order,
-    compensate_payment,
-    compensate_shipping
-)
-from .workflow import OrderWorkflow
+import time
 
 """
 Temporal Worker that hosts the OrderWorkflow and related activities.
@@ -25,30 +11,103 @@ Talking points for demos:
 - Connects to Temporal Server at localhost:7233 by default.
 - Uses task queue "order-task-queue" to receive work.
 - Registers both the workflow class and each activity function.
+- Activities are imported lazily so a worker can register only a subset,
+  e.g. a dedicated shipping worker:
+    python -m src.order_workflow.worker --task-queue shipping-task-queue \\
+        --activities arrange_shipping,compensate_shipping --no-workflows
+- Import time (temporalio included, hence the imports inside `main`) and cache
+  warm-up are reported before the worker starts polling.
 """
 interrupt_event = asyncio.Event()
 
+DEFAULT_TASK_QUEUE = "order-task-queue"
+
+# Every activity this worker can register, by name
+ACTIVITY_NAMES = (
+    "generate_order_id",
+    "reserve_inventory",
+    "check_payment",
+    "check_address",
+    "process_payment",
+    "quote_baskets",
+    "arrange_shipping",
+    "compensate_shipping",
+    "compensate_inventory_reserve",
+    "compensate_payment",
+    "compensate_order",
+)
+
+# Activities that read the shared inventory cache and so benefit from warm-up
+INVENTORY_ACTIVITIES = frozenset({"process_payment", "quote_baskets"})
+
+
+def load_activities(names=None):
+    """Import the activities module and return the requested activity functions.
+
+    Duplicate names are registered once. Raises ValueError for names that are
+    not known activities.
+    """
+    names = list(dict.fromkeys(names)) if names else list(ACTIVITY_NAMES)
+    unknown = [n for n in names if n not in ACTIVITY_NAMES]
+    if unknown:
+        raise ValueError(f"Unknown activities: {', '.join(unknown)}")
+    from . import activities
+    return [getattr(activities, n) for n in names]
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Order demo worker.")
+    parser.add_argument("--address", default="localhost:7233", help="Temporal Server address")
+    parser.add_argument("--task-queue", default=DEFAULT_TASK_QUEUE, help="Task queue to poll")
+    parser.add_argument(
+        "--activities",
+        default="",
+        help="Comma-separated activity names to register (default: all)",
+    )
+    parser.add_argument(
+        "--no-workflows",
+        action="store_true",
+        help="Register activities only, without hosting OrderWorkflow",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv=None):
+    args = _parse_args(argv)
+    names = [n.strip() for n in args.activities.split(",") if n.strip()]
+
+    # Measure the cost of importing temporalio and the code we actually host
+    started = time.perf_counter()
+    from temporalio.client import Client
+    from temporalio.worker import Worker
+    activities = load_activities(names)
+    workflows = []
+    if not args.no_workflows:
+        from .workflow import OrderWorkflow
+        workflows.append(OrderWorkflow)
+    imported = time.perf_counter()
+
+    print(
+        f"Imported {len(activities)} activities and {len(workflows)} workflows in "
+        f"{(imported - started) * 1000:.1f} ms"
+    )
+
+    # Parse the inventory now rather than on the first real order
+    if INVENTORY_ACTIVITIES.intersection(fn.__name__ for fn in activities):
+        from . import activities as activities_module
+        item_count = activities_module.warm_caches()
+        warmed = time.perf_counter()
+        print(f"Warmed {item_count} inventory items in {(warmed - imported) * 1000:.1f} ms")
 
-async def main():
     # Connect to Temporal Server. Change address if needed for your demo.
-    client = await Client.connect("localhost:7233")
+    client = await Client.connect(args.address)
     async with Worker(
         client,
-        task_queue="order-task-queue",
-        workflows=[OrderWorkflow],
-        activities=[
-            generate_order_id,
-            reserve_inventory,
-            check_payment,
-            check_address,
-            process_payment,
-            arrange_shipping,
-            compensate_shipping,
-            compensate_inventory_reserve,
-            compensate_payment,
-            compensate_order
-        ],
+        task_queue=args.task_queue,
+        workflows=workflows,
+        activities=activities,
     ):
+        print(f"Worker polling task queue {args.task_queue!r}")
         # Keep the worker alive until interrupted (Ctrl+C during demos)
         await interrupt_event.wait()
 
@@ -36,6 +36,8 @@ class OrderWorkflow:
         }
         # Track successful steps to demonstrate a minimal compensation pattern
         self.compensation = []
+        # Activity -> task queue routing from the run input; empty means our own queue
+        self._task_queues = {}
 
     @workflow.query
     def status(self):
@@ -56,19 +58,27 @@ class OrderWorkflow:
             "message": message,
             "state": state,
         })
+
+    def _queue(self, activity: str):
+        """Task queue for an activity, or None to use the workflow's own queue."""
+        return self._task_queues.get(activity)
+
     @workflow.signal
     def workflow_inputs(self, input):
         """Example signal to show how external inputs could be received."""
         self.input = input
 
     @workflow.run
-    async def run(self, item: str) -> str:
+    async def run(self, item: str, task_queues: dict[str, str] | None = None) -> str:
+        # Optional routing, e.g. {"arrange_shipping": "shipping-task-queue"}
+        self._task_queues = dict(task_queues or {})
         # Persist the item being ordered so the GUI can display it
         self._state["item"] = item
 
         # Generate an order ID and remember it for subsequent steps
         order_id = await workflow.execute_activity(
-            "generate_order_id", schedule_to_close_timeout=timedelta(seconds=30)
+            "generate_order_id", schedule_to_close_timeout=timedelta(seconds=30),
+            task_queue=self._queue("generate_order_id"),
         )
         self.compensation.append("order")
 
@@ -77,33 +87,38 @@ class OrderWorkflow:
         await workflow.sleep(1)
         try: 
             await workflow.execute_activity(
-                "reserve_inventory", args=(order_id, item), schedule_to_close_timeout=timedelta(seconds=30)
+                "reserve_inventory", args=(order_id, item), schedule_to_close_timeout=timedelta(seconds=30),
+                task_queue=self._queue("reserve_inventory"),
             )
             self.compensation.append("inventory_reserve")
             self._mark("inventory_reserved", f"Reserved inventory for {item}")
             await workflow.sleep(1)
 
             await workflow.execute_activity(
-                "check_payment", args=(order_id,), schedule_to_close_timeout=timedelta(seconds=30)
+                "check_payment", args=(order_id,), schedule_to_close_timeout=timedelta(seconds=30),
+                task_queue=self._queue("check_payment"),
             )
             self._mark("payment_verified", "Payment verified")
             await workflow.sleep(1)
 
             await workflow.execute_activity(
-                "check_address", args=(order_id,), schedule_to_close_timeout=timedelta(seconds=30)
+                "check_address", args=(order_id,), schedule_to_close_timeout=timedelta(seconds=30),
+                task_queue=self._queue("check_address"),
             )
             self._mark("address_verified", "Address verified")
             await workflow.sleep(1)
 
             await workflow.execute_activity(
-                "process_payment", args=(order_id,), schedule_to_close_timeout=timedelta(seconds=30)
+                "process_payment", args=(order_id,), schedule_to_close_timeout=timedelta(seconds=30),
+                task_queue=self._queue("process_payment"),
             )
             self._mark("paid", "Payment processed")
             await workflow.sleep(1)
             self.compensation.append("payment")
 
             await workflow.execute_activity(
-                "arrange_shipping", args=(order_id, item), schedule_to_close_timeout=timedelta(seconds=30)
+                "arrange_shipping", args=(order_id, item), schedule_to_close_timeout=timedelta(seconds=30),
+                task_queue=self._queue("arrange_shipping"),
             )
             self._mark("shipped", "Shipment arranged")
             await workflow.sleep(1)
@@ -114,6 +129,7 @@ class OrderWorkflow:
             if self.compensation:
                 for action in reversed(self.compensation):
                     await workflow.execute_activity(
-                        f"compensate_{action}", args=(order_id, item), schedule_to_close_timeout=timedelta(seconds=30)
+                        f"compensate_{action}", args=(order_id, item), schedule_to_close_timeout=timedelta(seconds=30),
+                        task_queue=self._queue(f"compensate_{action}"),
                     )
         return f"Order {order_id} completed successfully."